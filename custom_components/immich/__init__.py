@@ -3,6 +3,7 @@ from __future__ import annotations
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_API_KEY, CONF_HOST, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import DOMAIN
 from .hub import ImmichHub, InvalidAuth
@@ -15,7 +16,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
 
     # Initialize the API hub with the configuration data
-    hub = ImmichHub(host=entry.data[CONF_HOST], api_key=entry.data[CONF_API_KEY])
+    hub = ImmichHub(
+        host=entry.data[CONF_HOST],
+        api_key=entry.data[CONF_API_KEY],
+        session=async_get_clientsession(hass),
+    )
 
     if not await hub.authenticate():
         raise InvalidAuth
@@ -13,6 +13,7 @@ from homeassistant.const import CONF_API_KEY, CONF_HOST
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     CONF_WATCHED_ALBUMS,
@@ -53,7 +54,7 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     if not all([parsed_url.scheme, parsed_url.netloc]):
         raise ValueError("Invalid URL format")
 
-    hub = ImmichHub(host=url, api_key=api_key)
+    hub = ImmichHub(host=url, api_key=api_key, session=async_get_clientsession(hass))
 
     if not await hub.authenticate():
         raise InvalidAuth
@@ -138,12 +139,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             return self.async_create_entry(title="", data=user_input)
 
         try:
-            # Get a connection to the hub in order to list the available albums
-            url = url_normalize(self.config_entry.data[CONF_HOST])
-            api_key = self.config_entry.data[CONF_API_KEY]
-            hub = ImmichHub(host=url, api_key=api_key)
+            # Reuse the hub set up for this entry in order to list the available albums
+            hub: ImmichHub = self.hass.data[DOMAIN][self.config_entry.entry_id]
 
-            if not await hub.authenticate():
+            if not await hub.ensure_authenticated():
                 raise InvalidAuth
 
             # Get the list of albums and create a mapping of album id to album name
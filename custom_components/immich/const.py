@@ -11,10 +11,15 @@ CONF_WATCHED_ALBUMS: Final[str] = "watched_albums"
 API_TIMEOUT: Final[int] = 30
 """Timeout in seconds for API requests."""
 
-# Platform constants
-PLATFORMS: Final[list[str]] = ["image", "sensor"]
-"""List of platforms supported by this integration."""
+MAX_ASSET_SIZE: Final[int] = 50 * 1024 * 1024
+"""Maximum size in bytes of an asset downloaded for display."""
 
 # Default values
 DEFAULT_SCAN_INTERVAL: Final[int] = 300
 """Default interval in seconds between updates."""
+
+CACHE_TTL: Final[int] = DEFAULT_SCAN_INTERVAL // 2
+"""Time in seconds during which statistics responses are served from cache."""
+
+ALBUMS_CACHE_TTL: Final[int] = 60
+"""Time in seconds during which the album list is served from cache."""
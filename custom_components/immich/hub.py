@@ -1,21 +1,72 @@
 """Hub for Immich integration."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
+import functools
 import logging
 from dataclasses import dataclass
-from typing import Any, TypedDict
-from urllib.parse import urljoin
+from typing import Any, TypedDict, TypeVar
 import time
 
 import aiohttp
 
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util.json import json_loads
+
+from .const import ALBUMS_CACHE_TTL, API_TIMEOUT, CACHE_TTL, MAX_ASSET_SIZE
 
 _HEADER_API_KEY = "x-api-key"
 _LOGGER = logging.getLogger(__name__)
 
 _ALLOWED_MIME_TYPES = ["image/png", "image/jpeg"]
 
+_TIMEOUT = aiohttp.ClientTimeout(total=API_TIMEOUT)
+
+# Error bodies are only logged, so there is no point reading more than this
+_MAX_ERROR_BODY_BYTES = 2048
+
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Fan-out requests share this many keep-alive connections instead of opening one each
+_MAX_CONCURRENT_FAN_OUT = 4
+
+# Largest page size accepted by the Immich search endpoints
+_SEARCH_PAGE_SIZE = 1000
+
+# How long a successful authentication is trusted before checking the token again
+_AUTH_MAX_AGE = 300
+
+_T = TypeVar("_T")
+
+def _ttl_cached(
+    ttl: float,
+) -> Callable[[Callable[..., Awaitable[_T]]], Callable[..., Awaitable[_T]]]:
+    """Cache the result of an argument-less API method on the client for `ttl` seconds.
+
+    Concurrent callers missing the cache are coalesced onto a single request.
+    """
+    def decorator(func: Callable[..., Awaitable[_T]]) -> Callable[..., Awaitable[_T]]:
+        key = func.__name__
+
+        @functools.wraps(func)
+        async def wrapper(self: BaseAPIClient) -> _T:
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > time.monotonic():
+                _LOGGER.debug("Serving %s from cache", key)
+                return cached[1]
+
+            async def fetch() -> _T:
+                result = await func(self)
+                self._cache[key] = (time.monotonic() + ttl, result)
+                return result
+
+            return await self._single_flight(key, fetch)
+
+        return wrapper
+
+    return decorator
+
 class AssetInfo(TypedDict):
     id: str
     type: str
@@ -40,64 +91,119 @@ class AssetStatistics:
 class BaseAPIClient:
     """Base class for API operations."""
     
-    def __init__(self, host: str, api_key: str) -> None:
-        """Initialize."""
+    def __init__(self, host: str, api_key: str, session: aiohttp.ClientSession) -> None:
+        """Initialize with a shared session owned by the caller."""
         _LOGGER.debug("Initializing BaseAPIClient with host: %s", host)
         self.host = host
         self.api_key = api_key
-        self.headers = {
+        # Endpoints are appended to this directly, which also keeps any base path of the host
+        self._base_url = host.rstrip("/") + "/"
+        self.session = session
+        self._cache: dict[str, tuple[float, Any]] = {}
+        self._in_flight: dict[str, asyncio.Future[Any]] = {}
+        # URL -> (ETag, Last-Modified, parsed body) of the last conditional response
+        self._validators: dict[str, tuple[str | None, str | None, Any]] = {}
+        # Headers are built once and shared by every request of the same kind
+        self._json_headers = {
             "Accept": "application/json",
             _HEADER_API_KEY: self.api_key
         }
-        _LOGGER.debug("BaseAPIClient initialized with headers: %s", self.headers)
+        self._binary_headers = {
+            "Accept": "image/*",
+            # Images are already compressed, gzip would only cost CPU
+            "Accept-Encoding": "identity",
+            _HEADER_API_KEY: self.api_key
+        }
+
+    async def _single_flight(self, key: str, fetch: Callable[[], Awaitable[_T]]) -> _T:
+        """Run `fetch`, or join the identical call already in flight for `key`."""
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            _LOGGER.debug("Joining in-flight request for %s", key)
+        # Shield so that one cancelled caller does not cancel the request for the others
+        return await asyncio.shield(future)
 
     async def _make_request(
         self,
         method: str,
         endpoint: str,
         params: dict[str, Any] | None = None,
-        json_data: dict[str, Any] | None = None
+        json_data: dict[str, Any] | None = None,
+        conditional: bool = False
     ) -> Any:
-        """Make an API request with common error handling."""
-        start_time = time.time()
-        url = urljoin(self.host, endpoint)
-        _LOGGER.debug("Making %s request to %s", method, url)
-        _LOGGER.debug("Request params: %s", params)
-        _LOGGER.debug("Request json: %s", json_data)
+        """Make an API request with common error handling.
+
+        With `conditional`, the response validators are remembered and sent back on
+        the next call, so that an unchanged resource is served from memory on a 304.
+        """
+        url = self._base_url + endpoint.lstrip("/")
+        headers = self._json_headers
+        validators = self._validators.get(url) if conditional else None
+        if validators is not None:
+            etag, last_modified, _ = validators
+            headers = dict(headers)
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            start_time = time.perf_counter()
+            _LOGGER.debug("Making %s request to %s", method, url)
+            _LOGGER.debug("Request params: %s", params)
+            _LOGGER.debug("Request json: %s", json_data)
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.request(
-                    method=method,
-                    url=url,
-                    headers=self.headers,
-                    params=params,
-                    json=json_data
-                ) as response:
-                    response_time = time.time() - start_time
+            async with self.session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                params=params,
+                json=json_data,
+                timeout=_TIMEOUT
+            ) as response:
+                if debug:
+                    response_time = time.perf_counter() - start_time
                     _LOGGER.debug("Response received in %.2f seconds", response_time)
-                    
-                    if response.status != 200:
-                        raw_result = await response.text()
-                        _LOGGER.error("API Error: %s - %s", response.status, raw_result)
-                        _LOGGER.debug("Failed request details - URL: %s, Headers: %s", url, self.headers)
-                        raise ApiError(f"API returned {response.status}: {raw_result}")
-                    
-                    result = await response.json()
+                
+                if response.status == 304 and validators is not None:
+                    _LOGGER.debug("Resource not modified, reusing cached response for %s", url)
+                    return validators[2]
+
+                if response.status != 200:
+                    raw_result = (
+                        await response.content.read(_MAX_ERROR_BODY_BYTES)
+                    ).decode(errors="replace")
+                    _LOGGER.error("API Error: %s - %s", response.status, raw_result)
+                    _LOGGER.debug("Failed request details - URL: %s", url)
+                    raise ApiError(f"API returned {response.status}: {raw_result}")
+                
+                result = await response.json(loads=json_loads)
+                if debug:
                     _LOGGER.debug("API response: %s", result)
-                    return result
+
+                if conditional:
+                    etag = response.headers.get(aiohttp.hdrs.ETAG)
+                    last_modified = response.headers.get(aiohttp.hdrs.LAST_MODIFIED)
+                    if etag or last_modified:
+                        self._validators[url] = (etag, last_modified, result)
+                    else:
+                        self._validators.pop(url, None)
+                return result
         except aiohttp.ClientError as exception:
             _LOGGER.error("Connection error: %s", exception)
             _LOGGER.debug("Connection error details - URL: %s", url)
             raise CannotConnect from exception
-        except Exception as e:
-            _LOGGER.error("Unexpected error during API request: %s", str(e))
-            _LOGGER.debug("Error details - URL: %s, Method: %s", url, method)
-            raise
 
 class ImmichHub(BaseAPIClient):
     """Immich API hub."""
 
+    _last_auth_ok_ts: float | None = None
+
     async def authenticate(self) -> bool:
         """Test if we can authenticate with the host."""
         _LOGGER.debug("Starting authentication")
@@ -105,11 +211,22 @@ class ImmichHub(BaseAPIClient):
             result = await self._make_request("POST", "/api/auth/validateToken")
             auth_status = result.get("authStatus", False)
             _LOGGER.debug("Authentication result: %s", auth_status)
+            self._last_auth_ok_ts = time.monotonic() if auth_status else None
             return auth_status
         except Exception as e:
             _LOGGER.error("Authentication failed: %s", str(e))
             raise
 
+    async def ensure_authenticated(self, max_age: float = _AUTH_MAX_AGE) -> bool:
+        """Authenticate unless a previous authentication succeeded in the last `max_age` seconds."""
+        if (
+            self._last_auth_ok_ts is not None
+            and time.monotonic() - self._last_auth_ok_ts < max_age
+        ):
+            _LOGGER.debug("Reusing recent successful authentication")
+            return True
+        return await self.authenticate()
+
     async def get_my_user_info(self) -> UserInfo:
         """Get user info."""
         _LOGGER.debug("Getting user info")
@@ -135,22 +252,38 @@ class ImmichHub(BaseAPIClient):
     async def download_asset(self, asset_id: str) -> bytes | None:
         """Download the asset."""
         _LOGGER.debug("Downloading asset: %s", asset_id)
-        url = urljoin(self.host, f"/api/assets/{asset_id}/original")
+        url = f"{self._base_url}api/assets/{asset_id}/original"
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers={_HEADER_API_KEY: self.api_key}) as response:
-                    if response.status != 200:
-                        _LOGGER.error("Download error: %s", response.status)
-                        return None
-                    
-                    if response.content_type not in _ALLOWED_MIME_TYPES:
-                        _LOGGER.error("Unsupported MIME type: %s", response.content_type)
+            async with self.session.get(
+                url, headers=self._binary_headers, timeout=_TIMEOUT
+            ) as response:
+                if response.status != 200:
+                    _LOGGER.error("Download error: %s", response.status)
+                    return None
+                
+                if response.content_type not in _ALLOWED_MIME_TYPES:
+                    _LOGGER.error("Unsupported MIME type: %s", response.content_type)
+                    return None
+
+                if response.content_length is not None and response.content_length > MAX_ASSET_SIZE:
+                    _LOGGER.warning(
+                        "Skipping asset %s: %d bytes exceeds the %d bytes limit",
+                        asset_id, response.content_length, MAX_ASSET_SIZE
+                    )
+                    return None
+
+                asset_data = bytearray()
+                async for chunk in response.content.iter_chunked(_DOWNLOAD_CHUNK_SIZE):
+                    asset_data += chunk
+                    if len(asset_data) > MAX_ASSET_SIZE:
+                        _LOGGER.warning(
+                            "Skipping asset %s: exceeds the %d bytes limit", asset_id, MAX_ASSET_SIZE
+                        )
                         return None
-                    
-                    asset_data = await response.read()
-                    _LOGGER.debug("Successfully downloaded asset: %s", asset_id)
-                    return asset_data
+
+                _LOGGER.debug("Successfully downloaded asset: %s", asset_id)
+                return bytes(asset_data)
         except aiohttp.ClientError as exception:
             _LOGGER.error("Download connection error: %s", exception)
             raise CannotConnect from exception
@@ -158,21 +291,34 @@ class ImmichHub(BaseAPIClient):
     async def list_favorite_images(self) -> list[AssetInfo]:
         """List all favorite images."""
         _LOGGER.debug("Listing favorite images")
-        data = {"isFavorite": "true"}
+        # Let the server filter by type so that only images are sent back
+        data: dict[str, Any] = {
+            "isFavorite": True,
+            "type": "IMAGE",
+            "size": _SEARCH_PAGE_SIZE,
+            "page": 1,
+        }
         try:
-            result = await self._make_request("POST", "/api/search/metadata", json_data=data)
-            favorite_images = [asset for asset in result["assets"]["items"] if asset["type"] == "IMAGE"]
+            favorite_images: list[AssetInfo] = []
+            while True:
+                result = await self._make_request("POST", "/api/search/metadata", json_data=data)
+                favorite_images.extend(result["assets"]["items"])
+                next_page = result["assets"].get("nextPage")
+                if not next_page:
+                    break
+                data["page"] = int(next_page)
             _LOGGER.debug("Found %d favorite images", len(favorite_images))
             return favorite_images
         except Exception as e:
             _LOGGER.error("Failed to list favorite images: %s", str(e))
             raise
 
+    @_ttl_cached(ALBUMS_CACHE_TTL)
     async def list_all_albums(self) -> list[AlbumInfo]:
         """List all albums."""
         _LOGGER.debug("Listing all albums")
         try:
-            albums = await self._make_request("GET", "/api/albums")
+            albums = await self._make_request("GET", "/api/albums", conditional=True)
             _LOGGER.debug("Found %d albums", len(albums))
             return albums
         except Exception as e:
@@ -191,6 +337,7 @@ class ImmichHub(BaseAPIClient):
             _LOGGER.error("Failed to list album images: %s", str(e))
             raise
 
+    @_ttl_cached(CACHE_TTL)
     async def get_asset_statistics(self) -> AssetStatistics:
         """Get statistics for all assets."""
         _LOGGER.debug("Getting asset statistics")
@@ -207,6 +354,7 @@ class ImmichHub(BaseAPIClient):
             _LOGGER.error("Failed to get asset statistics: %s", str(e))
             raise
 
+    @_ttl_cached(CACHE_TTL)
     async def get_favorite_statistics(self) -> dict:
         """Get statistics for favorite assets."""
         _LOGGER.debug("Getting favorite assets statistics")
@@ -219,11 +367,12 @@ class ImmichHub(BaseAPIClient):
             _LOGGER.error("Failed to search assets: %s", str(e))
             raise
 
+    @_ttl_cached(CACHE_TTL)
     async def get_people(self) -> dict:
         """Get list of people with their details and statistics."""
         _LOGGER.debug("Getting list of people")
         try:
-            response = await self._make_request("GET", "/api/people")
+            response = await self._make_request("GET", "/api/people", conditional=True)
             people = response.get("people", [])
             total = response.get("total", 0)
             hidden = response.get("hidden", 0)
@@ -248,6 +397,28 @@ class ImmichHub(BaseAPIClient):
             _LOGGER.error("Failed to get statistics for person %s: %s", person_id, str(e))
             raise
 
+    async def get_all_person_statistics(self, person_ids: list[str]) -> dict[str, dict]:
+        """Get statistics for several people concurrently.
+
+        People whose statistics could not be fetched are left out of the result.
+        """
+        _LOGGER.debug("Getting statistics for %d people", len(person_ids))
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_FAN_OUT)
+
+        async def _get_person_statistics(person_id: str) -> dict:
+            async with semaphore:
+                return await self.get_person_statistics(person_id)
+
+        results = await asyncio.gather(
+            *(_get_person_statistics(person_id) for person_id in person_ids),
+            return_exceptions=True,
+        )
+        return {
+            person_id: stats
+            for person_id, stats in zip(person_ids, results)
+            if not isinstance(stats, BaseException)
+        }
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
@@ -1,21 +1,24 @@
 """Sensor platform for Immich integration."""
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 import logging
-from typing import Final
+from typing import Any, Final
 
 from homeassistant.components.sensor import (
+    DOMAIN as SENSOR_DOMAIN,
     SensorEntity,
     SensorStateClass,
     SensorDeviceClass,
     SensorEntityDescription
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_API_KEY, CONF_HOST
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
     DataUpdateCoordinator,
     UpdateFailed
 )
@@ -25,7 +28,7 @@ from .const import (
     DEFAULT_SCAN_INTERVAL,
     CONF_WATCHED_ALBUMS
 )
-from .hub import ImmichHub, CannotConnect, InvalidAuth
+from .hub import ApiError, ImmichHub, CannotConnect, InvalidAuth
 
 _LOGGER: Final = logging.getLogger(__name__)
 
@@ -76,42 +79,109 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Immich sensor platform."""
-    if DOMAIN not in hass.data:
-        hass.data[DOMAIN] = {"sensors": {}}
+    hub: ImmichHub = hass.data[DOMAIN][config_entry.entry_id]
 
-    hub = ImmichHub(
-        host=config_entry.data[CONF_HOST],
-        api_key=config_entry.data[CONF_API_KEY]
-    )
+    coordinator = ImmichCoordinator(hass, hub)
 
-    # Create static sensors
-    entities = [
-        ImmichSensor(hub, description)
+    # Create static sensors right away, so platform setup does not wait on the API
+    async_add_entities(
+        ImmichSensor(coordinator, description)
         for description in SENSORS
-    ]
-    
-    # Create dynamic person sensors
-    try:
-        people_data = await hub.get_people()
-        if isinstance(people_data, dict) and "people" in people_data:
-            for person in people_data["people"]:
-                if isinstance(person, dict) and person.get("name"):
-                    clean_name = person['name'].lower().replace(" ", "_")
-                    description = SensorEntityDescription(
-                        key=f"person_{clean_name}_assets",
-                        name=f"Immich: Person {person['name']} Assets",
-                        icon="mdi:account",
-                        native_unit_of_measurement="assets"
-                    )
-                    entity = ImmichSensor(hub, description)
-                    entity._original_name = person['name']  # Store original name
-                    entities.append(entity)
-    except Exception as e:
-        _LOGGER.error("Failed to create person sensors: %s", str(e))
-    
-    async_add_entities(entities, True)
-
-class ImmichSensor(SensorEntity):
+    )
+
+    # Create dynamic person sensors once the coordinator knows who exists
+    known_person_ids: set[str] = set()
+    entity_registry = er.async_get(hass)
+
+    @callback
+    def _async_add_person_sensors() -> None:
+        """Add sensors for people not seen in a previous refresh."""
+        if not coordinator.data:
+            return
+
+        entities = []
+        for person in coordinator.data["people"]:
+            if person["id"] in known_person_ids:
+                continue
+            known_person_ids.add(person["id"])
+
+            # Key by id so that renames and namesakes keep distinct, stable entities
+            key = f"person_{person['id']}"
+
+            # Move entities created when the key was derived from the name, to keep their history
+            clean_name = person['name'].lower().replace(" ", "_")
+            if entity_id := entity_registry.async_get_entity_id(
+                SENSOR_DOMAIN, DOMAIN, f"{DOMAIN}_person_{clean_name}_assets"
+            ):
+                entity_registry.async_update_entity(
+                    entity_id, new_unique_id=f"{DOMAIN}_{key}"
+                )
+
+            description = SensorEntityDescription(
+                key=key,
+                name=f"Immich: Person {person['name']} Assets",
+                icon="mdi:account",
+                native_unit_of_measurement="assets"
+            )
+            entities.append(ImmichSensor(coordinator, description, person_id=person["id"]))
+
+        if entities:
+            async_add_entities(entities)
+
+    config_entry.async_on_unload(
+        coordinator.async_add_listener(_async_add_person_sensors)
+    )
+    config_entry.async_create_background_task(
+        hass, coordinator.async_refresh(), "immich_sensor_first_refresh"
+    )
+
+class ImmichCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    """Fetch all Immich statistics once per interval for every sensor."""
+
+    def __init__(self, hass: HomeAssistant, hub: ImmichHub) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=DOMAIN,
+            update_interval=SCAN_INTERVAL,
+        )
+        self.hub = hub
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch statistics, issuing independent requests concurrently."""
+        try:
+            asset_stats, favorite_stats, people_data = await asyncio.gather(
+                self.hub.get_asset_statistics(),
+                self.hub.get_favorite_statistics(),
+                self.hub.get_people(),
+            )
+            people = [
+                person
+                for person in people_data["people"]
+                if isinstance(person, dict) and person.get("name")
+            ]
+            person_stats = await self.hub.get_all_person_statistics(
+                [person["id"] for person in people]
+            )
+        except (CannotConnect, InvalidAuth, ApiError) as err:
+            raise UpdateFailed(f"Error communicating with Immich: {err}") from err
+
+        return {
+            "total_images": asset_stats.images,
+            "total_videos": asset_stats.videos,
+            "total_assets": asset_stats.total,
+            "favorite_assets": favorite_stats.get("total", 0),
+            "total_people": people_data.get("total", 0),
+            "hidden_people": people_data.get("hidden", 0),
+            "people": people,
+            "person_assets": {
+                person_id: stats.get("assets", 0)
+                for person_id, stats in person_stats.items()
+            },
+        }
+
+class ImmichSensor(CoordinatorEntity[ImmichCoordinator], SensorEntity):
     """Representation of an Immich sensor."""
 
     _attr_has_entity_name = True
@@ -119,65 +189,23 @@ class ImmichSensor(SensorEntity):
 
     def __init__(
         self,
-        hub: ImmichHub,
+        coordinator: ImmichCoordinator,
         description: SensorEntityDescription,
+        person_id: str | None = None,
     ) -> None:
         """Initialize the sensor."""
-        self.hub = hub
+        super().__init__(coordinator)
         self.entity_description = description
         self._attr_unique_id = f"{DOMAIN}_{description.key}"
-        self._state = None
-        self._original_name = None
+        self._person_id = person_id
 
     @property
     def native_value(self) -> int | None:
         """Return the state of the sensor."""
-        return self._state
+        if not self.coordinator.data:
+            return None
 
-    async def async_update(self) -> None:
-        """Fetch new state data for the sensor."""
-        try:
-            if self.entity_description.key == "total_images":
-                stats = await self.hub.get_asset_statistics()
-                self._state = stats.images
-            elif self.entity_description.key == "total_videos":
-                stats = await self.hub.get_asset_statistics()
-                self._state = stats.videos
-            elif self.entity_description.key == "total_assets":
-                stats = await self.hub.get_asset_statistics()
-                self._state = stats.total
-            elif self.entity_description.key == "favorite_assets":
-                stats = await self.hub.get_favorite_statistics()
-                self._state = stats.get("total", 0)
-            elif self.entity_description.key == "total_people":
-                people_data = await self.hub.get_people()
-                self._state = people_data.get("total", 0)
-            elif self.entity_description.key == "hidden_people":
-                people_data = await self.hub.get_people()
-                self._state = people_data.get("hidden", 0)
-            elif self.entity_description.key.startswith("person_"):
-                if not hasattr(self, '_original_name'):
-                    _LOGGER.warning("Original name not found for %s", self.entity_description.key)
-                    self._state = None
-                    return
-                
-                people_data = await self.hub.get_people()
-                if not isinstance(people_data, dict) or "people" not in people_data:
-                    _LOGGER.error("Invalid people data structure received")
-                    self._state = None
-                    return
-                
-                person = next((p for p in people_data["people"] if isinstance(p, dict) and p.get("name", "").lower() == self._original_name.lower()), None)
-                if person:
-                    stats = await self.hub.get_person_statistics(person["id"])
-                    self._state = stats.get("assets", 0)
-                else:
-                    _LOGGER.warning("Could not find %s in people list", self._original_name)
-                    self._state = None
-                
-        except (CannotConnect, InvalidAuth) as err:
-            _LOGGER.error("Error updating %s: %s", self.entity_description.key, err)
-            self._state = None
-        except Exception as err:  # pylint: disable=broad-except
-            _LOGGER.exception("Unexpected error updating %s: %s", self.entity_description.key, err)
-            self._state = None
+        if self._person_id is not None:
+            return self.coordinator.data["person_assets"].get(self._person_id)
+
+        return self.coordinator.data.get(self.entity_description.key)